@@ -1,13 +1,48 @@
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi import Path as PathParam
+from fastapi.responses import HTMLResponse, ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from typing import Annotated, Optional, List, Dict, Any
 from pathlib import Path
-import json
-from datetime import datetime, timezone
+import asyncio
+import logging
+import orjson
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from prometheus_fastapi_instrumentator import Instrumentator
 
-app = FastAPI()
+logger = logging.getLogger(__name__)
+
+# 설치되어 있으면 libuv 기반 루프를 기본으로 사용 (실행 커맨드와 무관하게 적용)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+else:
+    uvloop.install()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 서버 수명 동안 변경분을 코얼레싱해 기록하는 백그라운드 flusher 실행
+    flusher = asyncio.create_task(_flusher())
+    try:
+        yield
+    finally:
+        flusher.cancel()
+        try:
+            await flusher
+        except asyncio.CancelledError:
+            pass
+        # 종료 시 남은 변경분을 마지막으로 flush
+        if _dirty:
+            await asyncio.to_thread(_write_snapshot)
+
+
+# orjson 기반 직렬화로 리스트 응답 CPU 비용 절감
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # Prometheus 메트릭스 엔드포인트 (/metrics)
 Instrumentator().instrument(app).expose(app, endpoint="/metrics")
@@ -15,6 +50,23 @@ Instrumentator().instrument(app).expose(app, endpoint="/metrics")
 # i18n Support
 MULTILANG_DIR = Path(__file__).resolve().parent / "multilang"
 _i18n_cache: Dict[str, Dict[str, Any]] = {}
+# 점 표기 키("api.todo_not_found")로 바로 찾는 평탄화 사전 (t()용)
+_i18n_flat: Dict[str, Dict[str, str]] = {}
+# /i18n 응답용 직렬화 바이트 캐시 (언어 파일은 로드 후 불변)
+_i18n_bytes: Dict[str, bytes] = {}
+
+
+def _flatten_messages(messages: Dict[str, Any], prefix: str = "") -> Dict[str, str]:
+    """Flatten nested message dict into single-level dotted keys"""
+    flat: Dict[str, str] = {}
+    for key, value in messages.items():
+        dotted = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten_messages(value, f"{dotted}."))
+        else:
+            flat[dotted] = value
+    return flat
+
 
 def load_i18n(lang: str = "ko") -> Dict[str, Any]:
     """Load language file from multilang directory"""
@@ -24,32 +76,31 @@ def load_i18n(lang: str = "ko") -> Dict[str, Any]:
             lang = "ko"  # fallback to Korean
             lang_file = MULTILANG_DIR / f"{lang}.json"
 
-        with open(lang_file, "r", encoding="utf-8") as f:
-            _i18n_cache[lang] = json.load(f)
+        messages = orjson.loads(lang_file.read_bytes())
+        _i18n_cache[lang] = messages
+        _i18n_flat[lang] = _flatten_messages(messages)
+        _i18n_bytes[lang] = orjson.dumps(messages)
 
     return _i18n_cache[lang]
 
+@lru_cache(maxsize=256)
+def _detect_lang(header: str) -> str:
+    # Simple language detection: ko, en
+    return "en" if "en" in header.lower() else "ko"
+
+
 def get_lang(request: Request) -> str:
     """Get language from Accept-Language header or default to Korean"""
-    accept_lang = request.headers.get("Accept-Language", "ko")
-    # Simple language detection: ko, en
-    if "en" in accept_lang.lower():
-        return "en"
-    return "ko"
+    # 같은 헤더 값을 보내는 클라이언트는 lower() + 부분 문자열 검사를 생략
+    return _detect_lang(request.headers.get("Accept-Language", "ko"))
 
 def t(request: Request, key_path: str) -> str:
     """Translate function - get message by dot-notation key path"""
     lang = get_lang(request)
-    messages = load_i18n(lang)
-
-    keys = key_path.split(".")
-    value = messages
-    for key in keys:
-        value = value.get(key, key_path)
-        if not isinstance(value, dict):
-            break
-
-    return value if isinstance(value, str) else key_path
+    if lang not in _i18n_flat:
+        load_i18n(lang)
+    # 평탄화 사전 덕분에 요청마다 split + 중첩 get 체인을 타지 않음
+    return _i18n_flat.get(lang, {}).get(key_path, key_path)
 
 # i18n message keys (constants to avoid string literal duplication)
 TODO_NOT_FOUND = "api.todo_not_found"
@@ -78,62 +129,249 @@ class TodoUpdate(BaseModel):
     group: Optional[int] = Field(default=None, ge=1, le=9)
 
 
+# 스키마 검증기는 임포트 시 1회만 빌드 (요청마다 재구성 방지)
+TODO_LIST_ADAPTER = TypeAdapter(List[TodoItem])
+
+
 BASE_DIR = Path(__file__).resolve().parent
 TEMPLATES_DIR = BASE_DIR / "templates"
 INDEX_FILE = TEMPLATES_DIR / "index.html"
+# 정적 파일이므로 임포트 시 1회만 읽어 메모리에 보관
+_INDEX_BYTES = INDEX_FILE.read_bytes() if INDEX_FILE.exists() else None
 
 
 TODO_FILE = BASE_DIR / "todo.json"
+# 변경 사항을 라인 단위로 덧붙이는 write-ahead log (스냅샷 기록 시 압축/삭제)
+TODO_WAL_FILE = BASE_DIR / "todo.log"
+
+
+def _now_iso(_time=time.time, _gmtime=time.gmtime, _strftime=time.strftime) -> str:
+    """현재 UTC 시각의 ISO8601 문자열.
+
+    datetime.now(timezone.utc).isoformat()의 tz 연산/포매팅 비용을 피해
+    time 모듈의 C 레벨 경로로 생성한다 (생성/완료 전환마다 호출됨).
+    time 함수들은 기본 인자로 바인딩해 전역 조회(LOAD_GLOBAL)를 제거.
+    """
+    now = _time()
+    return _strftime("%Y-%m-%dT%H:%M:%S", _gmtime(now)) + f".{int(now % 1 * 1e6):06d}+00:00"
+
+
+# 모듈 레벨 캐시: 디스크는 최초 1회만 읽고 이후 요청은 메모리에서 서빙
+# id -> todo 딕셔너리(삽입 순서 유지)라 개별 조회/수정/삭제가 모두 O(1)
+_TODOS_CACHE: Optional[Dict[int, dict]] = None
+_max_id = 0
+
+
+def _rebuild_cache(todos: List[dict]) -> None:
+    global _TODOS_CACHE, _max_id
+    _TODOS_CACHE = {todo["id"]: todo for todo in todos}
+    _max_id = max(_TODOS_CACHE, default=0)
+
+
+def _ensure_cache() -> Dict[int, dict]:
+    if _TODOS_CACHE is None:
+        _rebuild_cache(_read_todo_file())
+        _replay_wal()
+    return _TODOS_CACHE
+
+
+def _read_todo_file() -> List[dict]:
+    # 모듈 하단 init 블록이 파일 생성을 보장하므로 exists() stat을 생략하고
+    # 없을 때만 FileNotFoundError로 처리
+    try:
+        data = orjson.loads(TODO_FILE.read_bytes())
+        if isinstance(data, list):
+            # 디스크 데이터는 로드 시 1회만 검증/정규화하고 이후 캐시를 신뢰
+            items = TODO_LIST_ADAPTER.validate_python(data)
+            return TODO_LIST_ADAPTER.dump_python(items)
+    except (FileNotFoundError, orjson.JSONDecodeError, ValidationError):
+        pass
+    return []
 
 
 def load_todos() -> List[dict]:
-    if TODO_FILE.exists():
+    return list(_ensure_cache().values())
+
+
+# 디스크 flush 정책 (환경변수로 조정 가능)
+TODO_FLUSH_MS = int(os.environ.get("TODO_FLUSH_MS", "50"))
+TODO_FLUSH_MAX = int(os.environ.get("TODO_FLUSH_MAX", "100"))
+
+_dirty = False
+_pending_writes = 0
+_dirty_event = asyncio.Event()
+# 이벤트 루프 밖(테스트/스크립트/스레드풀)에서의 캐시 교체·기록 동기화용
+_cache_lock = threading.Lock()
+
+
+def _write_snapshot() -> None:
+    global _dirty, _pending_writes
+    with _cache_lock:
+        _dirty = False
+        _pending_writes = 0
+        # orjson은 항상 UTF-8 바이트를 생성하므로 ensure_ascii 불필요
+        payload = list(_TODOS_CACHE.values()) if _TODOS_CACHE is not None else []
+        blob = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        # 임시 파일에 한 번에 쓰고 os.replace로 원자 교체 (중단돼도 파일 손상 없음)
+        tmp = TODO_FILE.with_suffix(".json.tmp")
+        tmp.write_bytes(blob)
+        os.replace(tmp, TODO_FILE)
+        # 스냅샷이 최신이 되었으므로 로그는 압축(삭제)
+        _truncate_wal()
+
+
+_wal_handle = None
+
+
+def _append_wal(entry: dict) -> None:
+    """변경 1건을 todo.log에 추가. 스토어 크기와 무관하게 O(1) 바이트 기록.
+
+    _cache_lock을 잡아 스냅샷 flush(_truncate_wal이 핸들을 닫음)와 직렬화:
+    닫힌 핸들에 쓰는 경쟁을 막고, 스냅샷 생성과 로그 삭제 사이에 끼어든
+    변경이 로그에서 지워져 유실되는 창도 없앤다.
+    """
+    global _wal_handle
+    with _cache_lock:
+        if _wal_handle is None:
+            # 매 기록마다 flush하므로 큰 버퍼는 무의미 -> 기본 버퍼링 사용
+            _wal_handle = open(TODO_WAL_FILE, "ab")
+        _wal_handle.write(orjson.dumps(entry) + b"\n")
+        _wal_handle.flush()
+
+
+def _truncate_wal() -> None:
+    global _wal_handle
+    if _wal_handle is not None:
+        _wal_handle.close()
+        _wal_handle = None
+    if TODO_WAL_FILE.exists():
+        TODO_WAL_FILE.unlink()
+
+
+def _replay_wal() -> None:
+    """시작 시 todo.json 스냅샷 위에 todo.log의 변경분을 재적용"""
+    global _max_id
+    try:
+        lines = TODO_WAL_FILE.read_bytes().splitlines()
+    except FileNotFoundError:
+        return
+    cache = _TODOS_CACHE
+    for line in lines:
+        if not line:
+            continue
         try:
-            with open(TODO_FILE, "r", encoding="utf-8") as file:
-                data = json.load(file)
-                if isinstance(data, list):
-                    return data
-        except json.JSONDecodeError:
-            pass
-    return []
+            entry = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            break  # 크래시로 잘린 마지막 라인은 버림
+        if entry.get("op") == "delete":
+            cache.pop(entry.get("id"), None)
+        else:
+            # create/update 모두 전체 todo를 담으므로 단순 upsert로 재생
+            todo = entry.get("todo")
+            if isinstance(todo, dict) and "id" in todo:
+                cache[todo["id"]] = todo
+    _max_id = max(cache, default=0)
+
+
+async def _flush_now() -> None:
+    """스냅샷 1회 기록. 실패해도 예외를 삼키고 dirty로 되돌려 다음 주기에 재시도."""
+    global _dirty
+    try:
+        # 디스크 기록은 스레드로 내려 이벤트 루프를 막지 않음
+        await asyncio.to_thread(_write_snapshot)
+    except Exception:
+        logger.exception("todo.json flush 실패 - 변경분은 메모리에 유지, 재시도 예정")
+        _dirty = True
+        _dirty_event.set()
+
+
+async def _flusher() -> None:
+    """변경이 쌓이길 기다렸다가 TODO_FLUSH_MS 후 한 번에 기록하는 상주 태스크"""
+    while True:
+        await _dirty_event.wait()
+        await asyncio.sleep(TODO_FLUSH_MS / 1000)
+        _dirty_event.clear()
+        if _dirty:
+            await _flush_now()
+
+
+def _schedule_flush() -> None:
+    """연속된 변경을 1회의 디스크 기록으로 코얼레싱.
+
+    이벤트 루프 안에서는 상주 flusher를 깨우기만 하고, 루프 밖
+    (테스트/스크립트)에서는 즉시 동기 기록한다.
+    """
+    global _dirty, _pending_writes
+    _dirty = True
+    _pending_writes += 1
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _write_snapshot()
+        return
+    if _pending_writes >= TODO_FLUSH_MAX:
+        loop.create_task(_flush_now())
+        return
+    _dirty_event.set()
 
 
 def save_todos(todos: List[dict]) -> None:
-    with open(TODO_FILE, "w", encoding="utf-8") as file:
-        json.dump(todos, file, ensure_ascii=False, indent=4)
+    with _cache_lock:
+        _rebuild_cache(todos)
+    _schedule_flush()
+
+
+def next_id() -> int:
+    # 전체 스캔 대신 캐시 재구성 시 유지되는 최대 id 카운터 사용
+    return _max_id + 1
 
+# 이 개수를 넘는 목록은 전체 문자열 버퍼링 대신 스트리밍으로 전송
+STREAM_THRESHOLD = 1000
+
+
+def _stream_json_array(todos: List[dict]):
+    yield b"["
+    first = True
+    for todo in todos:
+        if not first:
+            yield b","
+        yield orjson.dumps(todo)
+        first = False
+    yield b"]"
 
-def next_id(todos: List[dict]) -> int:
-    return (max((t["id"] for t in todos), default=0) + 1) if todos else 1
 
 # Read
-@app.get("/todos", response_model=List[TodoItem])
-def get_todos():
-    return load_todos()
+@app.get("/todos")
+async def get_todos():
+    todos = load_todos()
+    if len(todos) > STREAM_THRESHOLD:
+        # 대용량 목록: 항목 단위로 직렬화하며 전송 (첫 바이트 지연/RSS 절감)
+        return StreamingResponse(_stream_json_array(todos), media_type="application/json")
+    return ORJSONResponse(content=todos)
 
 # Read - 그룹별 필터링
-@app.get("/todos/group/{group_id}", response_model=List[TodoItem])
-def get_todos_by_group(group_id: int, request: Request):
+@app.get("/todos/group/{group_id}")
+async def get_todos_by_group(group_id: int, request: Request):
     if group_id < 1 or group_id > 9:
         raise HTTPException(status_code=400, detail=t(request, "api.group_id_invalid"))
-    todos = load_todos()
-    filtered = [todo for todo in todos if todo.get("group") == group_id]
-    return filtered
+    # 캐시 values 뷰를 바로 순회 (중간 리스트 복사 없음)
+    filtered = [todo for todo in _ensure_cache().values() if todo["group"] == group_id]
+    return ORJSONResponse(content=filtered)
 
 # Read - 완료/미완료 상태별 필터링
-@app.get("/todos/status/{status}", response_model=List[TodoItem])
-def get_todos_by_status(status: str, request: Request):
-    todos = load_todos()
+@app.get("/todos/status/{status}")
+async def get_todos_by_status(status: str, request: Request):
+    todos = _ensure_cache().values()
     if status == "completed":
-        return [todo for todo in todos if todo.get("completed")]
+        return ORJSONResponse(content=[todo for todo in todos if todo["completed"]])
     elif status == "pending":
-        return [todo for todo in todos if not todo.get("completed")]
+        return ORJSONResponse(content=[todo for todo in todos if not todo["completed"]])
     else:
         raise HTTPException(status_code=400, detail=t(request, "api.status_invalid"))
 
 # Read - 정렬 기능
-@app.get("/todos/sorted", response_model=List[TodoItem])
-def get_sorted_todos(sort_by: str = "created_at", order: str = "desc", request: Request = None):
+@app.get("/todos/sorted")
+async def get_sorted_todos(sort_by: str = "created_at", order: str = "desc", request: Request = None):
     """
     정렬 가능한 필드: id, title, created_at, completed, completed_at, group
     정렬 순서: asc (오름차순), desc (내림차순)
@@ -150,25 +388,25 @@ def get_sorted_todos(sort_by: str = "created_at", order: str = "desc", request:
     todos = load_todos()
     reverse = (order == "desc")
     
-    # None 값 처리를 위한 정렬
-    def sort_key(todo):
-        value = todo.get(sort_by)
-        # None 값 처리: 타입 일관성 유지
-        if value is None:
-            # 오름차순: None을 맨 앞으로, 내림차순: None을 맨 뒤로
-            return "" if not reverse else "\uffff"
-        return value
-    
-    sorted_todos = sorted(todos, key=sort_key, reverse=reverse)
-    return sorted_todos
+    # None 값 처리: 오름차순은 None을 맨 앞으로, 내림차순은 맨 뒤로
+    sentinel = "" if not reverse else "\uffff"
+    # 키를 O(n)으로 선추출(decorate-sort-undecorate)해서 비교 루프에서
+    # 파이썬 레벨 dict.get + None 분기를 제거
+    keys = [value if (value := todo.get(sort_by)) is not None else sentinel
+            for todo in todos]
+    order_idx = sorted(range(len(todos)), key=keys.__getitem__, reverse=reverse)
+    sorted_todos = [todos[i] for i in order_idx]
+    return ORJSONResponse(content=sorted_todos)
 
 # Create
-@app.post("/todos", response_model=TodoItem)
-def create_todo(todo: TodoCreate):
-    todos = load_todos()
-    now = datetime.now(timezone.utc).isoformat()
-    item = TodoItem(
-        id=next_id(todos),
+@app.post("/todos")
+async def create_todo(todo: TodoCreate):
+    global _max_id
+    cache = _ensure_cache()
+    now = _now_iso()
+    # 모든 필드가 서버에서 계산/검증된 값이므로 재검증 없이 생성
+    item = TodoItem.model_construct(
+        id=next_id(),
         title=todo.title,
         description=todo.description,
         created_at=now,
@@ -176,9 +414,12 @@ def create_todo(todo: TodoCreate):
         completed_at=None,
         group=todo.group or 1,
     )
-    todos.append(item.model_dump())
-    save_todos(todos)
-    return item
+    data = item.model_dump()
+    cache[item.id] = data
+    _max_id = item.id
+    _append_wal({"op": "create", "todo": data})
+    _schedule_flush()
+    return ORJSONResponse(content=data)
 
 # Helper functions for update_todo
 def _apply_simple_fields(todo: dict, patch: TodoUpdate) -> None:
@@ -192,76 +433,82 @@ def _apply_simple_fields(todo: dict, patch: TodoUpdate) -> None:
 
 def _update_completed_status(todo: dict, new_completed: bool) -> None:
     """Update completed status and manage completed_at timestamp"""
-    prev_completed = bool(todo.get("completed", False))
-    todo["completed"] = bool(new_completed)
-
-    # Set completed_at when transitioning from incomplete to complete
-    if todo["completed"] and not prev_completed:
-        todo["completed_at"] = datetime.now(timezone.utc).isoformat()
-    # Clear completed_at when marking as incomplete
-    elif not todo["completed"]:
-        todo["completed_at"] = None
+    new = bool(new_completed)
+    # 상태가 실제로 바뀔 때만 기록: 완료 전환 시 타임스탬프, 해제 시 null
+    if new != todo.get("completed", False):
+        todo["completed"] = new
+        todo["completed_at"] = _now_iso() if new else None
 
 
 # Update
-@app.put("/todos/{todo_id}", response_model=TodoItem)
-def update_todo(todo_id: int, patch: TodoUpdate, request: Request):
-    todos = load_todos()
-    for i, todo in enumerate(todos):
-        if todo.get("id") == todo_id:
-            # Apply simple field updates
-            _apply_simple_fields(todo, patch)
+@app.put("/todos/{todo_id}")
+async def update_todo(todo_id: Annotated[int, PathParam(ge=1)], patch: TodoUpdate, request: Request):
+    todo = _ensure_cache().get(todo_id)
+    if todo is None:
+        raise HTTPException(status_code=404, detail=t(request, TODO_NOT_FOUND))
+
+    # Apply simple field updates
+    _apply_simple_fields(todo, patch)
 
-            # Handle completed status updates
-            if patch.completed is not None:
-                _update_completed_status(todo, patch.completed)
+    # Handle completed status updates
+    if patch.completed is not None:
+        _update_completed_status(todo, patch.completed)
 
-            todos[i] = todo
-            save_todos(todos)
-            return TodoItem(**todo)
-    raise HTTPException(status_code=404, detail=t(request, TODO_NOT_FOUND))
+    # 제자리 수정이라 캐시 구조가 그대로 유효 -> 로그 추가 후 flush만 예약
+    _append_wal({"op": "update", "todo": todo})
+    _schedule_flush()
+    # 캐시의 dict는 이미 응답 스키마와 동일 -> 모델 재구성 없이 그대로 직렬화
+    return ORJSONResponse(content=todo)
 
 # Delete
 @app.delete("/todos/{todo_id}", response_model=dict)
-def delete_todo(todo_id: int, request: Request):
-    todos = load_todos()
-    new_todos = [todo for todo in todos if todo.get("id") != todo_id]
-    if len(new_todos) == len(todos):
+async def delete_todo(todo_id: Annotated[int, PathParam(ge=1)], request: Request):
+    cache = _ensure_cache()
+    if cache.pop(todo_id, None) is None:
         raise HTTPException(status_code=404, detail=t(request, TODO_NOT_FOUND))
-    save_todos(new_todos)
+    # _max_id는 단조 증가 카운터로 유지 (삭제된 id는 재사용하지 않음)
+    _append_wal({"op": "delete", "id": todo_id})
+    _schedule_flush()
     return {"message": t(request, TODO_DELETED)}
 
 #이거는 풋이랑 딜리트에서 먼저 읽을때 이용(개별항목)
-@app.get("/todos/{todo_id}", response_model=TodoItem)
-def get_todo(todo_id: int, request: Request):
-    todos = load_todos()
-    for todo in todos:
-        if todo.get("id") == todo_id:
-            return TodoItem(**todo)
-    raise HTTPException(status_code=404, detail=t(request, TODO_NOT_FOUND))
+@app.get("/todos/{todo_id}")
+async def get_todo(todo_id: Annotated[int, PathParam(ge=1)], request: Request):
+    todo = _ensure_cache().get(todo_id)
+    if todo is None:
+        raise HTTPException(status_code=404, detail=t(request, TODO_NOT_FOUND))
+    return ORJSONResponse(content=todo)
 
 
-@app.get("/", response_class=HTMLResponse)
-def read_root(request: Request):
-    if not INDEX_FILE.exists():
+@app.get("/", response_class=HTMLResponse, include_in_schema=False)
+async def read_root(request: Request):
+    if _INDEX_BYTES is None:
         raise HTTPException(status_code=500, detail=t(request, "api.index_not_found"))
-    with open(INDEX_FILE, "r", encoding="utf-8") as file:
-        content = file.read()
-    return HTMLResponse(content=content)
+    # 프로세스 생존 동안 불변이므로 브라우저 캐시도 허용
+    return HTMLResponse(content=_INDEX_BYTES, headers={"Cache-Control": "public, max-age=300"})
 
 
 # i18n API - Get language file for frontend
 @app.get("/i18n/{lang}")
-def get_i18n(lang: str):
+async def get_i18n(lang: str):
     """Return language file for frontend i18n"""
     try:
-        messages = load_i18n(lang)
-        return messages
+        load_i18n(lang)
     except Exception:
-        # Fallback to Korean
-        return load_i18n("ko")
-
-
-#요구사항에 따라 앱 로드시 빈 배열로 초기화
-with open(TODO_FILE, "w", encoding="utf-8") as file:
-    json.dump([], file, ensure_ascii=False, indent=4)
+        lang = "ko"  # Fallback to Korean
+        load_i18n(lang)
+    # 로드 시 직렬화해 둔 바이트를 그대로 반환 (요청마다 재직렬화하지 않음)
+    payload = _i18n_bytes.get(lang)
+    if payload is None:
+        load_i18n("ko")
+        payload = _i18n_bytes["ko"]
+    return Response(payload, media_type="application/json")
+
+
+#앱 로드시 저장 파일 보장. 기본은 기존 데이터 보존이며(재시작/멀티 워커에서
+#서로 파일을 덮어쓰지 않도록), TODO_RESET=1일 때만 빈 배열로 초기화
+if os.environ.get("TODO_RESET") == "1":
+    if not TODO_FILE.exists() or TODO_FILE.read_bytes().strip() != b"[]":
+        TODO_FILE.write_bytes(b"[]")
+elif not TODO_FILE.exists():
+    TODO_FILE.write_bytes(b"[]")
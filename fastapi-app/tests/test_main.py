@@ -4,6 +4,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 import pytest
 from fastapi.testclient import TestClient
+import main
 from main import app, save_todos, load_todos, TodoItem, load_i18n
 from datetime import datetime, timezone
 
@@ -65,6 +66,19 @@ def test_get_todos_with_items():
     assert response.json()[1]["title"] == "Test 2"
 
 
+def test_get_todos_streams_large_list():
+    """STREAM_THRESHOLD 초과 목록도 버퍼링 경로와 동일한 JSON 응답"""
+    todos = [create_test_todo(id=i, title=f"Task {i}").model_dump()
+             for i in range(1, main.STREAM_THRESHOLD + 2)]
+    save_todos(todos)
+
+    response = client.get("/todos")
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == main.STREAM_THRESHOLD + 1
+    assert data == load_todos()
+
+
 def test_create_todo_basic():
     """기본 todo 생성"""
     todo_data = {"title": "New Task", "description": "Task description"}
@@ -210,6 +224,13 @@ def test_delete_todo_not_found():
     assert response.status_code == 404
 
 
+def test_todo_id_zero_rejected():
+    """todo_id < 1은 핸들러 진입 전에 422로 거부"""
+    assert client.get("/todos/0").status_code == 422
+    assert client.put("/todos/0", json={"title": "X"}).status_code == 422
+    assert client.delete("/todos/0").status_code == 422
+
+
 # ============================================
 # Group Filtering Tests
 # ============================================
@@ -364,6 +385,60 @@ def test_sorted_todos_invalid_order():
     assert response.status_code == 400
 
 
+# ============================================
+# WAL (todo.log) Recovery Tests
+# ============================================
+
+def _simulate_restart():
+    """프로세스 재시작 시뮬레이션: 메모리 캐시를 버리고 디스크에서 다시 로드"""
+    main._TODOS_CACHE = None
+
+
+def test_wal_replay_after_restart():
+    """스냅샷 기록 전 create/update/delete가 로그 재생으로 복원됨"""
+    client.post("/todos", json={"title": "Keep"})
+    client.post("/todos", json={"title": "Drop"})
+    client.put("/todos/1", json={"completed": True})
+    client.delete("/todos/2")
+    before = client.get("/todos").json()
+
+    _simulate_restart()
+
+    after = client.get("/todos").json()
+    assert after == before
+    assert len(after) == 1
+    assert after[0]["title"] == "Keep"
+    assert after[0]["completed"] is True
+
+
+def test_wal_truncated_last_line_discarded():
+    """크래시로 잘린 마지막 로그 라인은 무시하고 그 앞까지만 재생"""
+    client.post("/todos", json={"title": "Complete entry"})
+    with open(main.TODO_WAL_FILE, "ab") as f:
+        f.write(b'{"op": "create", "todo": {"id": 2')  # 잘린 라인
+
+    _simulate_restart()
+
+    todos = client.get("/todos").json()
+    assert len(todos) == 1
+    assert todos[0]["title"] == "Complete entry"
+
+
+def test_wal_compacted_on_snapshot_flush():
+    """스냅샷 기록 시 로그가 삭제되고 스냅샷만으로 상태가 복원됨"""
+    client.post("/todos", json={"title": "Persisted"})
+    assert main.TODO_WAL_FILE.exists()
+
+    # 루프 밖 save_todos -> 즉시 스냅샷 기록 + 로그 압축
+    save_todos(load_todos())
+
+    assert not main.TODO_WAL_FILE.exists()
+    _simulate_restart()
+    todos = client.get("/todos").json()
+    assert len(todos) == 1
+    assert todos[0]["title"] == "Persisted"
+
+
 # ============================================
 # Integration Tests
 # ============================================